@@ -10,7 +10,10 @@ import numpy as np
 import pandas as pd
 import statsmodels.api as sm
 
+from app import CACHE_DIR, INITIAL_CAPITAL, _PARQUET_OK, _portfolio_nav
+
 DB_PATH = Path(__file__).resolve().parent / "portfolio.db"
+FF5_CACHE = CACHE_DIR / "verify-ff5_daily.parquet"
 PASS = "[PASS]"
 WARN = "[WARN]"
 FAIL = "[FAIL]"
@@ -84,16 +87,47 @@ daily_alpha = 0.0001
 ann = daily_alpha * 252
 check("  0.0001 * 252 == 0.0252", abs(ann - 0.0252) < 1e-12, f"got {ann:.4f}")
 
+# 1e. float32 GEMM in the NAV path
+print("\n  [1e] NAV via float32 R @ W vs float64 reference  (1000 days, 50 tickers, 12 portfolios)")
+rng = np.random.default_rng(0)
+R_test = rng.normal(0.0004, 0.012, size=(1_000, 50))
+W_test = rng.dirichlet(np.ones(50), size=12).T   # (tickers × portfolios), columns sum to 1
+nav32 = _portfolio_nav(R_test, W_test)
+nav64 = INITIAL_CAPITAL * np.cumprod(1.0 + R_test @ W_test, axis=0)
+nav_diff = float(np.abs(nav32[-1] - nav64[-1]).max())
+check("  |NAV32 - NAV64| at end < 1e-4", nav_diff < 1e-4, f"max diff {nav_diff:.2e}")
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 2. FF5 DATA INTEGRITY
 # ─────────────────────────────────────────────────────────────────────────────
 section("2 · FF5 DATA INTEGRITY")
 
-with sqlite3.connect(DB_PATH) as conn:
-    ff5_raw = pd.read_sql(
-        "SELECT date, mkt_rf, smb, hml, rmw, cma, rf FROM ff5_daily ORDER BY date",
-        conn,
-    )
+def _db_mtime():
+    # WAL mode: recent writes may only have reached the -wal file so far.
+    paths = [DB_PATH, DB_PATH.with_name(DB_PATH.name + "-wal")]
+    return max(p.stat().st_mtime for p in paths if p.exists())
+
+def load_ff5_raw():
+    """ff5_daily as stored, via a parquet copy that is reused until the DB changes."""
+    if _PARQUET_OK and FF5_CACHE.exists() and FF5_CACHE.stat().st_mtime >= _db_mtime():
+        try:
+            return pd.read_parquet(FF5_CACHE, engine="pyarrow")
+        except Exception:
+            pass
+    with sqlite3.connect(DB_PATH) as conn:
+        df = pd.read_sql(
+            "SELECT date, mkt_rf, smb, hml, rmw, cma, rf FROM ff5_daily ORDER BY date",
+            conn,
+        )
+    if _PARQUET_OK:
+        try:
+            FF5_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(FF5_CACHE, engine="pyarrow", index=False)
+        except Exception:
+            pass
+    return df
+
+ff5_raw = load_ff5_raw()
 
 print(f"\n  Shape: {ff5_raw.shape}  (expect ~15 000+ rows, 7 cols)")
 check("  rows > 10 000",  len(ff5_raw) > 10_000, f"got {len(ff5_raw)}")
@@ -146,9 +180,13 @@ nav_pivot = nav_raw.pivot(index="date", columns="portfolio_name", values="nav")
 nav_pivot.columns.name = None
 nav_pivot.index = pd.to_datetime(nav_pivot.index)
 
-# Daily returns
-ret = nav_pivot.pct_change().iloc[1:]
-ret = ret.replace([np.inf, -np.inf], np.nan)
+# Daily returns, computed in place on the raw NAV array; ±inf → NaN
+nav_vals = nav_pivot.to_numpy(dtype=np.float64)
+with np.errstate(divide="ignore", invalid="ignore"):
+    ret_vals = np.divide(nav_vals[1:], nav_vals[:-1])
+ret_vals -= 1.0
+ret_vals[~np.isfinite(ret_vals)] = np.nan
+ret = pd.DataFrame(ret_vals, index=nav_pivot.index[1:], columns=nav_pivot.columns)
 
 # Align
 common_idx = ret.index.intersection(ff5_dec.index)
@@ -230,27 +268,49 @@ PORTFOLIOS_ORDER = [
     "Grok-Expert","DeepSeek-DeepThink","Gemini-3 DeepResearch ",
 ]
 
+# Every portfolio shares the same design matrix, so the gap-free ones are
+# solved together in a single lstsq call; only columns with NaN gaps need
+# their own row subset.
+present = [p for p in PORTFOLIOS_ORDER if p in ret_al.columns]
+Y_all   = ret_al[present].sub(ff5_al["rf"], axis=0)
+X_all   = Xc_all.values
+nobs    = Y_all.notna().sum()
+fits    = {}   # pname -> (params[6], r2, n)
+
+def _ols_stats(X, Y, B):
+    resid = Y - X @ B
+    tss = ((Y - Y.mean(axis=0)) ** 2).sum(axis=0)
+    rss = (resid ** 2).sum(axis=0)
+    return 1.0 - rss / tss
+
+full = [p for p in present if nobs[p] == len(Y_all)] if len(Y_all) >= 20 else []
+if full:
+    Y = Y_all[full].values
+    B, *_ = np.linalg.lstsq(X_all, Y, rcond=None)
+    for j, (p, r2) in enumerate(zip(full, _ols_stats(X_all, Y, B))):
+        fits[p] = (B[:, j], r2, len(Y))
+for p in present:
+    if p in fits or nobs[p] < 20:
+        continue
+    mask = Y_all[p].notna().values
+    X, y = X_all[mask], Y_all[p].values[mask][:, None]
+    B, *_ = np.linalg.lstsq(X, y, rcond=None)
+    fits[p] = (B[:, 0], _ols_stats(X, y, B)[0], len(y))
+
 audit_results = {}
 for pname in PORTFOLIOS_ORDER:
     if pname not in ret_al.columns:
         print(f"  {'(missing)':28} | {pname}")
         continue
-    y = (ret_al[pname] - ff5_al["rf"]).dropna()
-    if len(y) < 20:
-        print(f"  {pname[:28]:<28} | INSUFFICIENT DATA ({len(y)} obs)")
+    if pname not in fits:
+        print(f"  {pname[:28]:<28} | INSUFFICIENT DATA ({nobs[pname]} obs)")
         continue
-    Xfit = Xc_all.loc[y.index]
-    fit  = sm.OLS(y, Xfit).fit()
-    alpha_ann  = fit.params["const"] * 252
-    beta_mkt   = fit.params["mkt_rf"]
-    beta_smb   = fit.params["smb"]
-    beta_hml   = fit.params["hml"]
-    beta_rmw   = fit.params["rmw"]
-    beta_cma   = fit.params["cma"]
-    r2         = fit.rsquared
-    n          = int(fit.nobs)
+    params, r2, n = fits[pname]
+    alpha, beta_mkt, beta_smb, beta_hml, beta_rmw, beta_cma = map(float, params)
+    alpha_ann  = alpha * 252
+    r2         = float(r2)
     audit_results[pname] = dict(
-        alpha=fit.params["const"], alpha_ann=alpha_ann,
+        alpha=alpha, alpha_ann=alpha_ann,
         beta_mkt=beta_mkt, beta_smb=beta_smb, beta_hml=beta_hml,
         beta_rmw=beta_rmw, beta_cma=beta_cma, r_squared=r2, n=n,
     )